@@ -1,8 +1,15 @@
+import asyncio
+import hashlib
+import threading
+import time
 import requests
-from pydantic import Field, HttpUrl, BaseModel
+from pydantic import ConfigDict, Field, HttpUrl, BaseModel
 from typing import Optional, Literal, List
 from datetime import datetime
 import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+from psycopg2.extras import RealDictCursor, execute_values
 import cloudinary
 import cloudinary.uploader
 from dotenv import load_dotenv
@@ -11,27 +18,44 @@ from fastapi import (
     FastAPI, UploadFile, File, Form, Depends,
     Query, HTTPException, Request
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
-from huggingface_hub import InferenceClient
+from contextlib import contextmanager
+from collections import OrderedDict
+import jinja2
 import json
 
 # -------------------------------------------------------------
 #  Basic setup
 # -------------------------------------------------------------
+load_dotenv()
 app = FastAPI()
 
-# Setup Jinja2 templates (absolute path)
+# Setup Jinja2 templates (absolute path). Templates are compiled once per
+# process: no per-render stat() for changes, and compiled bytecode is cached
+# on disk so fresh workers skip parsing too. Set TEMPLATES_AUTO_RELOAD=1 in
+# development to pick up template edits without a restart.
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "").lower() in ("1", "true", "yes")
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(BASE_DIR / "templates")),
+    autoescape=True,
+    auto_reload=TEMPLATES_AUTO_RELOAD,
+    cache_size=400,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+))
 
 
 # -------------------------------------------------------------
 #  Layer 1: Data Schemas (Pydantic)
 # -------------------------------------------------------------
 class ItemCreate(BaseModel):
+    # image_url and tag are filled in after validation; assignments skip the validator
+    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=False, extra="ignore")
+
     item_type: Literal["lost", "found"] = Field(description="Whether the item was lost or found")
     item_name: str = Field(min_length=2, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
@@ -70,17 +94,94 @@ class ItemsListResponse(BaseModel):
 # -------------------------------------------------------------
 #  Layer 2: Database setup (PostgreSQL / Neon)
 # -------------------------------------------------------------
-load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-def get_connection():
-    return psycopg2.connect(DATABASE_URL)
-
-
-def init_db():
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
+# One pool per process; connections are checked out per request instead of
+# opening a fresh TCP/TLS session every time. DB_MAX_CONNECTIONS is the
+# budget for the whole app and is split across the uvicorn workers, so keep
+# it under the server's max_connections.
+# psycopg2 closes returned connections once DB_POOL_MIN are already idle, so
+# raising it keeps more connections warm at the cost of holding them open.
+WORKERS = int(os.getenv("WEB_CONCURRENCY", 1))
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 20))
+DB_POOL_MAX = max(1, DB_MAX_CONNECTIONS // WORKERS)
+DB_POOL_MIN = min(int(os.getenv("DB_POOL_MIN", 2)), DB_POOL_MAX)
+# The pool is opened on first use (or in the startup hook) rather than at
+# import, so a `python main.py` supervisor that only spawns workers never
+# connects, while scripts and tests outside the app lifecycle still work.
+POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+POOL_LOCK = threading.Lock()
+# getconn() raises instead of waiting when the pool is exhausted, and the
+# threadpool runs more threads than that, so callers queue here first.
+POOL_SLOTS = threading.BoundedSemaphore(DB_POOL_MAX)
+# Neon suspends idle compute and drops its connections without the client
+# noticing, so connections idle longer than this are pinged before reuse.
+POOL_PING_AFTER = 30.0
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """Connection that remembers when it was last returned to the pool."""
+    last_used: Optional[float] = None
+
+
+def open_pool():
+    global POOL
+    with POOL_LOCK:
+        if POOL is None:
+            POOL = psycopg2.pool.ThreadedConnectionPool(
+                minconn=DB_POOL_MIN, maxconn=DB_POOL_MAX, dsn=DATABASE_URL,
+                connection_factory=PooledConnection,
+            )
+
+
+def is_alive(conn: PooledConnection) -> bool:
+    if conn.closed:
+        return False
+    if conn.last_used is None or time.monotonic() - conn.last_used < POOL_PING_AFTER:
+        return True
+    try:
+        conn.cursor().execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def checkout() -> PooledConnection:
+    if POOL is None:
+        open_pool()
+    while True:
+        conn = POOL.getconn()
+        if is_alive(conn):
+            return conn
+        POOL.putconn(conn, close=True)
+
+
+@contextmanager
+def get_conn():
+    with POOL_SLOTS:
+        conn = checkout()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            # A dropped connection fails the rollback too; keep the real error
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                pass
+            raise
+        finally:
+            conn.last_used = time.monotonic()
+            POOL.putconn(conn, close=bool(conn.closed))
+
+
+# Schema changes, applied in order and recorded in schema_migrations so that
+# worker startups only pay for a single SELECT once the schema is current.
+# Statements stay idempotent for databases created before this table existed.
+MIGRATIONS = [
+    (1, [
+        """
         CREATE TABLE IF NOT EXISTS items (
             id SERIAL PRIMARY KEY,
             item_type VARCHAR(20) NOT NULL,
@@ -91,13 +192,155 @@ def init_db():
             image_path TEXT,
             tag VARCHAR(50),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-    """)
-    conn.commit()
-    conn.close()
+        )
+        """,
+        # Trigram indexes let the leading-wildcard ILIKE search avoid a seq scan
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS idx_items_name_trgm ON items USING gin (item_name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_items_location_trgm ON items USING gin (location gin_trgm_ops)",
+        # Lets the listing walk rows newest-first and stop at the LIMIT
+        "CREATE INDEX IF NOT EXISTS idx_items_created_at_id_desc ON items (created_at DESC, id DESC)",
+    ]),
+    (2, [
+        # Single-row table bumped on every write; drives the page ETags
+        """
+        CREATE TABLE IF NOT EXISTS items_version (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """,
+        "INSERT INTO items_version (id) VALUES (TRUE) ON CONFLICT DO NOTHING",
+    ]),
+]
+# Arbitrary key for the advisory lock serializing migrations across workers
+MIGRATION_LOCK_ID = 7204
+
+
+def current_schema_version(cursor) -> int:
+    cursor.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+    if not cursor.fetchone()[0]:
+        return 0
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    return cursor.fetchone()[0]
+
+
+def init_db():
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        if current_schema_version(cursor) >= MIGRATIONS[-1][0]:
+            return
+
+        # Another worker may be migrating; wait for it and re-check
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+        version = current_schema_version(cursor)
+        cursor.execute("CREATE TABLE IF NOT EXISTS schema_migrations (version INT PRIMARY KEY)")
+        for migration_version, statements in MIGRATIONS:
+            if migration_version <= version:
+                continue
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (migration_version,))
+
 
 # Initialize database at startup
-init_db()
+@app.on_event("startup")
+def setup_db():
+    open_pool()
+    init_db()
+
+
+@app.on_event("shutdown")
+def close_pool():
+    if POOL:
+        POOL.closeall()
+
+
+# psycopg2 is blocking, so the query helpers below are meant to be called
+# through run_in_threadpool from the async routes.
+def escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user input only ever matches literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def fetch_items(
+    search: str = "",
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    limit: int = 50,
+) -> List[dict]:
+    """Return up to `limit` items newest-first, optionally after the
+    (`before`, `before_id`) cursor. id breaks ties between rows inserted in
+    the same transaction, which share created_at; `before` alone returns
+    rows strictly older than that timestamp."""
+    conditions = []
+    params = {"limit": limit}
+    if search:
+        # The pattern is bound once and referenced by both columns
+        conditions.append("(item_name ILIKE %(pattern)s OR location ILIKE %(pattern)s)")
+        params["pattern"] = f"%{escape_like(search)}%"
+    if before and before_id is not None:
+        conditions.append("(created_at, id) < (%(before)s, %(before_id)s)")
+        params["before"] = before
+        params["before_id"] = before_id
+    elif before:
+        # Hand-written links may only give a timestamp
+        conditions.append("created_at < %(before)s")
+        params["before"] = before
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_conn() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor.execute(f"""
+            SELECT * FROM items
+            {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT %(limit)s
+        """, params)
+        return cursor.fetchall()
+
+
+def fetch_item(item_id: int) -> Optional[dict]:
+    with get_conn() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor.execute("SELECT * FROM items WHERE id = %s", (item_id,))
+        return cursor.fetchone()
+
+
+def insert_item(item: ItemCreate):
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO items (item_type, item_name, description, location, contact_info, image_path, tag)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, (item.item_type, item.item_name, item.description, item.location,
+              item.contact_info, item.image_url, item.tag))
+        touch_items_version(cursor)
+
+
+def bulk_insert_items(rows: List[tuple]):
+    """Insert many (item_type, item_name, description, location, contact_info,
+    image_path, tag) rows using multi-row VALUES statements.
+
+    Scripts running outside the app should call init_db() first so the
+    schema exists; the pool itself opens on first use."""
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        execute_values(cursor, """
+            INSERT INTO items (item_type, item_name, description, location, contact_info, image_path, tag)
+            VALUES %s
+        """, rows, page_size=500)
+        touch_items_version(cursor)
+
+
+def touch_items_version(cursor):
+    cursor.execute("UPDATE items_version SET updated_at = now()")
+
+
+def fetch_items_version() -> datetime:
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT updated_at FROM items_version")
+        return cursor.fetchone()[0]
 
 
 # -------------------------------------------------------------
@@ -110,9 +353,24 @@ cloudinary.config(
 )
 
 
+# Above this size, images are sent to Cloudinary in chunks instead of one request
+LARGE_UPLOAD_THRESHOLD = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 6_000_000
+
+
 def save_uploaded_image(file: UploadFile) -> str:
     if file.filename:
-        upload_result = cloudinary.uploader.upload(file.file, folder="lost_and_found/")
+        # Starlette has already spooled the body to a temp file; stream it
+        # from there rather than reading it into memory.
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+        file.file.seek(0)
+        if size > LARGE_UPLOAD_THRESHOLD:
+            upload_result = cloudinary.uploader.upload_large(
+                file.file, chunk_size=UPLOAD_CHUNK_SIZE, folder="lost_and_found/"
+            )
+        else:
+            upload_result = cloudinary.uploader.upload(file.file, folder="lost_and_found/")
         return upload_result.get("secure_url", "")
     return ""
 
@@ -121,56 +379,272 @@ def save_uploaded_image(file: UploadFile) -> str:
 #  Layer 4: Utility functions
 # -------------------------------------------------------------
 
-client = InferenceClient(api_key=os.getenv("HUGGINGFACE_API_KEY"))
 API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-mnli"
-HEADERS = {"Authorization": f"Bearer {client}"}
-
-def auto_tag_item(item_name: str, description: str) -> str:
-    """Use Hugging Face zero-shot classifier for tagging."""
-    text = f"{item_name} {description}"
-    labels = [
-        # Core everyday objects
-        "electronics", "clothing", "accessories", "documents", "books",
-        "sports_equipment", "toys", "keys", "tools",
-
-        # Personal items
-        "wallets_and_purses", "bags_and_backpacks", "jewelry", "watches",
-        "glasses_and_sunglasses", "umbrellas", "cosmetics_and_makeup",
-
-        # Identification / official items
-        "id_cards_and_badges", "credit_cards", "driver_license", "passport", "tickets",
-
-        # Academic / work items
-        "stationery", "notebooks", "laptops_and_tablets", "usb_drives",
-        "calculators", "school_supplies", "office_supplies",
-
-        # Transport / mobility
-        "bicycles", "helmets", "vehicle_keys",
-
-        # Miscellaneous
-        "food_containers", "bottles", "miscellaneous"
-    ]
-    payload = {
-        "inputs": text,
-        "parameters": {
-            "candidate_labels": labels,
-            "multi_label": False
-        }
-    }
+HEADERS = {"Authorization": f"Bearer {os.getenv('HUGGINGFACE_API_KEY')}"}
+
+# Reuse one keep-alive session so each tagging call skips the TLS handshake
+HF_SESSION = requests.Session()
+HF_SESSION.headers.update(HEADERS)
+
+# Candidate categories for the zero-shot classifier
+LABELS = (
+    # Core everyday objects
+    "electronics", "clothing", "accessories", "documents", "books",
+    "sports_equipment", "toys", "keys", "tools",
+
+    # Personal items
+    "wallets_and_purses", "bags_and_backpacks", "jewelry", "watches",
+    "glasses_and_sunglasses", "umbrellas", "cosmetics_and_makeup",
+
+    # Identification / official items
+    "id_cards_and_badges", "credit_cards", "driver_license", "passport", "tickets",
+
+    # Academic / work items
+    "stationery", "notebooks", "laptops_and_tablets", "usb_drives",
+    "calculators", "school_supplies", "office_supplies",
+
+    # Transport / mobility
+    "bicycles", "helmets", "vehicle_keys",
+
+    # Miscellaneous
+    "food_containers", "bottles", "miscellaneous"
+)
+TAG_PARAMETERS = {
+    "candidate_labels": LABELS,
+    "multi_label": False
+}
+
+# Many reports share the same wording ("keys", "black wallet"...), so tags are
+# kept in a small in-process LRU keyed by a digest of the normalized text.
+# It is only touched from the event loop, so no locking is needed.
+TAG_CACHE_SIZE = 4096
+_tag_cache = OrderedDict()
+
+
+def tag_cache_key(item_name: str, description: str) -> str:
+    text = f"{item_name.lower().strip()}|{description.lower().strip()}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def get_cached_tag(key: str) -> Optional[str]:
+    tag = _tag_cache.get(key)
+    if tag is not None:
+        _tag_cache.move_to_end(key)
+    return tag
+
+
+def store_cached_tag(key: str, tag: str):
+    _tag_cache[key] = tag
+    if len(_tag_cache) > TAG_CACHE_SIZE:
+        _tag_cache.popitem(last=False)
+
+
+def parse_tag(result) -> Optional[str]:
+    if isinstance(result, dict) and "labels" in result:
+        return result["labels"][0].lower()
+    elif isinstance(result, list) and result and "label" in result[0]:
+        return result[0]["label"].lower()
+    print("Unexpected response:", result)
+    return None
+
+
+def classify_texts(texts: List[str]) -> List[Optional[str]]:
+    """Use Hugging Face zero-shot classifier for tagging a batch of texts."""
+    payload = {"inputs": texts, "parameters": TAG_PARAMETERS}
 
     try:
-        response = requests.post(API_URL, headers=HEADERS, json=payload)
+        response = HF_SESSION.post(API_URL, json=payload, timeout=10)
         result = response.json()
-        if isinstance(result, dict) and "labels" in result:
-            return result["labels"][0].lower()
-        elif isinstance(result, list) and "label" in result[0]:
-            return result[0]["label"].lower()
-        else:
-            print("Unexpected response:", result)
-            return "miscellaneous"
+        # Batched inputs come back as one result per text
+        if isinstance(result, list) and len(result) == len(texts) and all(isinstance(r, dict) for r in result):
+            return [parse_tag(r) for r in result]
+        if len(texts) == 1:
+            return [parse_tag(result)]
+        print("Unexpected response:", result)
     except Exception as e:
         print("Tagging error:", e)
-        return "miscellaneous"
+    return [None] * len(texts)
+
+
+class TagBatcher:
+    """Coalesces concurrent tagging requests into a single Hugging Face call.
+
+    Requests are collected until `max_batch` are waiting or `max_delay`
+    seconds have passed since the first one, then sent as one batch. Up to
+    `max_concurrent` batches are in flight at once, each bounded by `timeout`.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 16,
+        max_delay: float = 0.02,
+        max_concurrent: int = 8,
+        timeout: float = 15.0,
+    ):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_concurrent = max_concurrent
+        # Upper bound on a single batch; covers the 10s HTTP timeout
+        self.timeout = timeout
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+        self.slots: Optional[asyncio.Semaphore] = None
+        self.batches = set()
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(self.max_concurrent)
+        self.worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.worker:
+            self.worker.cancel()
+            try:
+                await self.worker
+            except asyncio.CancelledError:
+                pass
+        for task in list(self.batches):
+            task.cancel()
+        await asyncio.gather(*self.batches, return_exceptions=True)
+        # Anything still queued never made it into a batch
+        while self.queue and not self.queue.empty():
+            _, _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_result("miscellaneous")
+
+    async def submit(self, item_name: str, description: str) -> str:
+        key = tag_cache_key(item_name, description)
+        tag = get_cached_tag(key)
+        if tag is not None:
+            return tag
+
+        text = f"{item_name} {description}"
+        if self.worker is None or self.worker.done():
+            # Not started (no lifespan events) or the worker died: tag directly
+            tags = await self._classify([text])
+            if tags[0] is not None:
+                store_cached_tag(key, tags[0])
+            return tags[0] or "miscellaneous"
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((key, text, future))
+        # Batches always resolve their futures within `timeout`; this only
+        # guards against waiting on a free slot behind other slow batches.
+        try:
+            return await asyncio.wait_for(future, 2 * self.timeout + self.max_delay)
+        except asyncio.TimeoutError:
+            print("Tagging timed out")
+            return "miscellaneous"
+
+    async def _collect(self) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _classify(self, texts: List[str]) -> List[Optional[str]]:
+        try:
+            return await asyncio.wait_for(run_in_threadpool(classify_texts, texts), self.timeout)
+        except asyncio.TimeoutError:
+            print("Tagging timed out")
+        except Exception as e:
+            print("Tagging error:", e)
+        return [None] * len(texts)
+
+    async def _process(self, batch: list):
+        tags = [None] * len(batch)
+        try:
+            tags = await self._classify([text for _, text, _ in batch])
+        finally:
+            self.slots.release()
+            for (key, _, future), tag in zip(batch, tags):
+                if tag is not None:
+                    store_cached_tag(key, tag)
+                # Failures are not cached, the next submission should retry
+                if not future.done():
+                    future.set_result(tag or "miscellaneous")
+
+    async def _run(self):
+        while True:
+            # Leave requests queued while every slot is busy so they join
+            # the next batch instead of piling up behind a slow one
+            await self.slots.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self.slots.release()
+                raise
+            task = asyncio.create_task(self._process(batch))
+            self.batches.add(task)
+            task.add_done_callback(self.batches.discard)
+
+
+tag_batcher = TagBatcher()
+
+
+@app.on_event("startup")
+async def start_tag_batcher():
+    tag_batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_tag_batcher():
+    await tag_batcher.stop()
+    HF_SESSION.close()
+
+
+# Item pages only change when something is submitted, so they carry an ETag
+# derived from items_version. Clients must still revalidate every time (a
+# fresh cached listing would hide an item just submitted, since submit_item
+# redirects there), but a matching ETag skips the query and render.
+# The version is cached briefly per worker for plain requests. Conditional
+# requests always read it fresh (a one-row lookup): another worker may have
+# just taken a submission, and a stale version would answer 304 for it.
+ITEMS_VERSION_TTL = 1.0
+_items_version = {"value": None, "fetched_at": 0.0}
+
+
+async def get_items_version(fresh: bool = False) -> datetime:
+    now = asyncio.get_running_loop().time()
+    if fresh or _items_version["value"] is None or now - _items_version["fetched_at"] > ITEMS_VERSION_TTL:
+        _items_version["value"] = await run_in_threadpool(fetch_items_version)
+        _items_version["fetched_at"] = now
+    return _items_version["value"]
+
+
+def invalidate_items_version():
+    _items_version["value"] = None
+
+
+def make_etag(version: datetime, key: str) -> str:
+    return '"' + hashlib.md5(f"{version.isoformat()}:{key}".encode()).hexdigest() + '"'
+
+
+def cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    # "*" is not honoured: the check runs before the item lookup, so it
+    # would answer 304 for ids that don't exist
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
 
 
 # -------------------------------------------------------------
@@ -199,46 +673,58 @@ async def report_found(request: Request):
     })
 
 
-@app.get("/view-items", response_class=HTMLResponse)
-async def view_items(request: Request, search: str = ""):
-    conn = get_connection()
-    cursor = conn.cursor()
-    if search:
-        cursor.execute("""
-            SELECT * FROM items
-            WHERE item_name ILIKE %s OR location ILIKE %s
-            ORDER BY created_at DESC
-        """, (f"%{search}%", f"%{search}%"))
-    else:
-        cursor.execute("SELECT * FROM items ORDER BY created_at DESC")
+MAX_SEARCH_LENGTH = 100
 
-    rows = cursor.fetchall()
-    columns = [desc[0] for desc in cursor.description]
-    items = [dict(zip(columns, row)) for row in rows]
-    conn.close()
 
-    return templates.TemplateResponse("items.html", {
+@app.get("/view-items", response_class=HTMLResponse)
+async def view_items(
+    request: Request,
+    search: str = "",
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    page_size: int = Query(50, ge=1, le=200),
+):
+    # Long search strings only make the trigram scan more expensive
+    search = search.strip()[:MAX_SEARCH_LENGTH]
+    conditional = "if-none-match" in request.headers
+    etag = make_etag(await get_items_version(fresh=conditional), str(request.url.query))
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
+
+    # Fetch one extra row to know whether an older page exists
+    items = await run_in_threadpool(fetch_items, search, before, before_id, page_size + 1)
+    next_before = next_before_id = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_before = items[-1]["created_at"]
+        next_before_id = items[-1]["id"]
+
+    response = templates.TemplateResponse("items.html", {
         "request": request,
         "items": items,
-        "search": search
+        "search": search,
+        "page_size": page_size,
+        "next_before": next_before,
+        "next_before_id": next_before_id
     })
+    response.headers.update(cache_headers(etag))
+    return response
 
 
 @app.get("/item/{item_id}", response_class=HTMLResponse)
 async def view_item_detail(request: Request, item_id: int):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM items WHERE id = %s", (item_id,))
-    row = cursor.fetchone()
-    conn.close()
+    conditional = "if-none-match" in request.headers
+    etag = make_etag(await get_items_version(fresh=conditional), f"item:{item_id}")
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
 
-    if not row:
+    item = await run_in_threadpool(fetch_item, item_id)
+    if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    columns = ["id", "item_type", "item_name", "description", "location", "contact_info",
-               "image_path", "tag", "created_at"]
-    item = dict(zip(columns, row))
-    return templates.TemplateResponse("item_detail.html", {"request": request, "item": item})
+    response = templates.TemplateResponse("item_detail.html", {"request": request, "item": item})
+    response.headers.update(cache_headers(etag))
+    return response
 
 
 # -------------------------------------------------------------
@@ -249,27 +735,33 @@ async def submit_item(
     item: ItemCreate = Depends(ItemCreate.as_form),
     image: UploadFile = File(None)
 ):
-    image_url = ""
+    # Upload and tagging are independent network calls, so run them together
+    tag_task = tag_batcher.submit(item.item_name, item.description or "")
     if image and image.filename:
-        image_url = save_uploaded_image(image)
+        upload_task = run_in_threadpool(save_uploaded_image, image)
+        image_url, tag = await asyncio.gather(upload_task, tag_task)
         item.image_url = image_url
-
-    tag = auto_tag_item(item.item_name, item.description or "")
+    else:
+        tag = await tag_task
     item.tag = tag
 
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO items (item_type, item_name, description, location, contact_info, image_path, tag)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """, (item.item_type, item.item_name, item.description, item.location,
-          item.contact_info, item.image_url, item.tag))
-    conn.commit()
-    conn.close()
+    await run_in_threadpool(insert_item, item)
+    invalidate_items_version()
 
     return RedirectResponse(url="/view-items", status_code=303)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Workers re-import this module; they read it to split the DB budget
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        # "auto" picks uvloop/httptools when installed (uvloop isn't on Windows)
+        loop="auto",
+        http="auto",
+    )